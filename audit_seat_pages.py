@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Audit the generated seat pages for drift.
+Every page is normalized by masking its seat number, its <script> and <style>
+blocks are hashed, and pages are grouped by the resulting fingerprint. The
+largest group is the reference; for every other group a minimal diff of just
+the blocks that differ is printed.
+
+Exits with status 1 when more than one fingerprint is found.
+"""
+
+import argparse
+import difflib
+import glob
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import update_seat_durations
+import update_seat_files
+from create_seat_pages import TEMPLATE_FILE, load_seat_ids, mask_seat_number, render_seat_page
+
+SEAT_PLACEHOLDER = '{N}'
+MAX_DIFF_LINES = 40
+
+# Auditing fewer pages than this is faster in-process than in a worker pool
+PARALLEL_PAGE_THRESHOLD = 64
+
+_SEAT_PAGE = re.compile(r'seat(\d+)\.html$')
+_BLOCK = re.compile(r'<(script|style)\b([^>]*)>(.*?)</\1>', re.DOTALL | re.IGNORECASE)
+
+# Stands in for the seat number when the template is rendered for masking
+_SEAT_SENTINEL = '\x00seat\x00'
+_template_lines = {}
+
+
+def load_template_lines(template=TEMPLATE_FILE):
+    """Return (static lines, seat lines) of the template's script/style blocks.
+
+    The template is rendered with a sentinel seat number, both as it is and
+    migrated, so the seat lines hold the sentinel exactly where
+    render_seat_page writes the seat number. Literal numbers such as the
+    'Seat 2' chart labels stay in the static lines and are never masked.
+    """
+    template = os.path.abspath(template)
+    if template not in _template_lines:
+        static, seat = set(), set()
+        try:
+            with open(template, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except OSError:
+            source = None
+        if source is not None:
+            migrated = update_seat_durations.migrate_content(update_seat_files.migrate_content(source))
+            for content in (source, migrated):
+                for match in _BLOCK.finditer(render_seat_page(content, _SEAT_SENTINEL)):
+                    for line in match.group(3).splitlines():
+                        line = line.strip()
+                        if line:
+                            (seat if _SEAT_SENTINEL in line else static).add(line)
+        _template_lines[template] = static, seat
+    return _template_lines[template]
+
+
+def normalize_blocks(content, seat_number):
+    """Return the page's script/style blocks as (label, lines) with the seat masked.
+
+    A line that matches a template line is masked exactly where the template
+    renders the seat number. Only lines that have drifted from the template
+    fall back to masking every seat-number prefix. Indentation and blank
+    lines are dropped so that re-indentation by a migration is not reported
+    as drift.
+    """
+    static_lines, seat_lines = load_template_lines()
+    seat = str(seat_number)
+    rendered = {line.replace(_SEAT_SENTINEL, seat): line.replace(_SEAT_SENTINEL, SEAT_PLACEHOLDER)
+                for line in seat_lines}
+
+    def mask(line):
+        if line in rendered:
+            return rendered[line]
+        if line in static_lines:
+            return line
+        return mask_seat_number(line, seat, SEAT_PLACEHOLDER)
+
+    blocks = []
+    counts = {}
+    for match in _BLOCK.finditer(content):
+        kind = match.group(1).lower()
+        counts[kind] = counts.get(kind, 0) + 1
+        attributes = mask_seat_number(' '.join(match.group(2).split()), seat, SEAT_PLACEHOLDER)
+        lines = [mask(line.strip()) for line in match.group(3).splitlines() if line.strip()]
+        label = f'<{kind}{" " + attributes if attributes else ""}> #{counts[kind]}'
+        blocks.append((label, lines))
+    return blocks
+
+
+def fingerprint_page(path):
+    """Return (path, fingerprint, block hashes) for one seat page."""
+    seat = _SEAT_PAGE.search(os.path.basename(path))
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    hashes = []
+    for label, lines in normalize_blocks(content, seat.group(1)):
+        digest = hashlib.sha256()
+        digest.update(label.encode('utf-8'))
+        for line in lines:
+            digest.update(b'\n')
+            digest.update(line.encode('utf-8'))
+        hashes.append(digest.hexdigest())
+    fingerprint = hashlib.sha256(''.join(hashes).encode('ascii')).hexdigest()
+    return path, fingerprint, hashes
+
+
+def fingerprint_pages(paths, workers=None):
+    """Fingerprint all pages, in a process pool when there are many of them."""
+    if len(paths) >= PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count()) * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fingerprint_page, paths, chunksize=chunksize))
+    return [fingerprint_page(path) for path in paths]
+
+
+def group_by_fingerprint(results):
+    """Return [(fingerprint, [paths], block hashes)], largest group first."""
+    groups = {}
+    for path, fingerprint, hashes in results:
+        groups.setdefault(fingerprint, ([], hashes))[0].append(path)
+    ordered = sorted(groups.items(), key=lambda item: (-len(item[1][0]), _seat_key(item[1][0][0])))
+    return [(fingerprint, sorted(paths, key=_seat_key), hashes)
+            for fingerprint, (paths, hashes) in ordered]
+
+
+def _seat_key(path):
+    seat = _SEAT_PAGE.search(os.path.basename(path))
+    return int(seat.group(1)) if seat else 0, path
+
+
+def block_diff(reference, reference_hashes, outlier, outlier_hashes):
+    """Return unified diff lines for only the blocks that differ between two pages.
+
+    Blocks are paired up by label, so a block added or removed in one page
+    is reported as such and the blocks around it are still compared line by
+    line.
+    """
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return normalize_blocks(content, _SEAT_PAGE.search(os.path.basename(path)).group(1))
+
+    reference_blocks, outlier_blocks = load(reference), load(outlier)
+    ref_name, out_name = os.path.basename(reference), os.path.basename(outlier)
+
+    # Match on the label without its "#k" position, which shifts when a block is added
+    matcher = difflib.SequenceMatcher(
+        None, [label.rsplit(' #', 1)[0] for label, _ in reference_blocks],
+        [label.rsplit(' #', 1)[0] for label, _ in outlier_blocks], autojunk=False)
+    structure, pairs = [], []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != 'equal':
+            structure.append(f'@@ -{i1 + 1},{i2 - i1} +{j1 + 1},{j2 - j1} @@')
+            structure.extend(f'-{label}' for label, _ in reference_blocks[i1:i2])
+            structure.extend(f'+{label}' for label, _ in outlier_blocks[j1:j2])
+        # Blocks whose attributes changed in place are still compared line by line
+        if tag == 'equal' or (tag == 'replace' and i2 - i1 == j2 - j1):
+            pairs.extend(zip(range(i1, i2), range(j1, j2)))
+
+    lines = [f'--- {ref_name} blocks', f'+++ {out_name} blocks'] + structure if structure else []
+    for i, j in pairs:
+        if reference_hashes[i] != outlier_hashes[j]:
+            (ref_label, ref_lines), (out_label, out_lines) = reference_blocks[i], outlier_blocks[j]
+            lines.extend(difflib.unified_diff(
+                ref_lines, out_lines, f'{ref_name} {ref_label}', f'{out_name} {out_label}',
+                n=0, lineterm=''))
+    return lines
+
+
+def main():
+    """Audit seat pages and report drift."""
+    parser = argparse.ArgumentParser(description="Find seat pages that have drifted apart.")
+    parser.add_argument("pages", nargs="*", help="pages to audit (default: seat*.html)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--max-lines", type=int, default=MAX_DIFF_LINES,
+                        help=f"diff lines shown per outlier group (default {MAX_DIFF_LINES})")
+    args = parser.parse_args()
+
+    paths = sorted((path for path in (args.pages or glob.glob('seat*.html'))
+                    if _SEAT_PAGE.search(os.path.basename(path))), key=_seat_key)
+    if not paths:
+        print("❌ No seat pages found")
+        sys.exit(1)
+
+    print(f"🔍 Auditing {len(paths)} seat pages...")
+    missing = sorted(set(load_seat_ids()) - {_seat_key(path)[0] for path in paths})
+    if not args.pages and missing:
+        print(f"⚠️ Registered seats without a page: {missing}")
+
+    groups = group_by_fingerprint(fingerprint_pages(paths, args.workers))
+    reference_fingerprint, reference_pages, reference_hashes = groups[0]
+
+    def summary(pages):
+        names = ', '.join(os.path.basename(page) for page in pages[:5])
+        return names + (f" +{len(pages) - 5} more" if len(pages) > 5 else "")
+
+    print(f"📊 {len(groups)} fingerprint(s) across {len(paths)} pages\n")
+    print(f"✅ {reference_fingerprint[:12]}  {len(reference_pages)} page(s)  {summary(reference_pages)}  (reference)")
+
+    for fingerprint, pages, hashes in groups[1:]:
+        print(f"\n⚠️ {fingerprint[:12]}  {len(pages)} page(s)  {summary(pages)}")
+        diff = block_diff(reference_pages[0], reference_hashes, pages[0], hashes)
+        for line in diff[:args.max_lines]:
+            print(f"   {line}")
+        if len(diff) > args.max_lines:
+            print(f"   ... {len(diff) - args.max_lines} more lines")
+
+    if len(groups) == 1:
+        print("\n🎉 All seat pages match")
+    else:
+        print(f"\n❌ {len(paths) - len(reference_pages)} page(s) drifted from the reference")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""
+Asset pipeline for the Hotseat Network dashboard.
+Minifies inline JS/CSS, writes content-hashed copies of the local scripts the
+pages load, precompresses everything to gzip and brotli, rewrites the page
+references and records the result in dist/asset-manifest.json.
+
+Rebuilds are incremental: unchanged sources are not re-minified and outputs
+that already exist are not recompressed. Watch mode skips compression
+("none"); a "best" build compresses anything such a build left behind.
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from create_seat_pages import mask_seat_number
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = "dist"
+MANIFEST_NAME = "asset-manifest.json"
+
+# Pages keep their names - the QR codes and plates point straight at them
+PAGE_PATTERNS = ["index.HTML", "analytics.html", "seat*.html"]
+
+# Files fetched at runtime by their literal name, copied through unhashed
+PASSTHROUGH_FILES = ["mqtt-config.json", "firebase-config.js"]
+PASSTHROUGH_DIRS = ["qr_codes", "Img"]
+
+HASHED_EXTENSIONS = (".js", ".css")
+COMPRESSED_EXTENSIONS = (".html", ".HTML", ".js", ".css", ".json")
+HASH_LENGTH = 10
+
+# gzip and brotli levels per compression mode. Brotli at quality 11 costs
+# about 90 ms a page, too slow to rerun on every save; "none" drops the stale
+# .gz/.br of rebuilt files instead of compressing them
+COMPRESSION_LEVELS = {
+    "best": {"gzip": 9, "br": 11},
+    "none": None,
+}
+
+# Seat pages are rendered from one template and differ only in the seat
+# number, so they are minified once with the number masked out
+_SEAT_PAGE = re.compile(r'^seat(\d+)\.html$')
+_SEAT_PLACEHOLDER = "8675309142857"
+_MINIFIED_PAGE_CACHE_SIZE = 16
+_minified_pages = {}
+
+# Asset references per page, keyed by the page's stat signature
+_page_references = {}
+
+# Rebuilding fewer pages than this is faster in-process than in a worker pool
+PARALLEL_PAGE_THRESHOLD = 64
+
+# JavaScript tokens; strings and comments are matched whole so nothing inside
+# them is ever touched
+_JS_TOKEN = re.compile(r'''
+    (?P<ws>[ \t\r\n\f\v\u00a0\ufeff]+)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<word>[\w$]+)
+  | (?P<template>`)
+  | (?P<punct>.)
+''', re.DOTALL | re.VERBOSE)
+
+_JS_REGEX_LITERAL = re.compile(r'/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/')
+_JS_TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.DOTALL)
+
+# A "/" after these starts a regex literal rather than a division
+_JS_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = {
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete",
+    "void", "throw", "instanceof", "yield", "await",
+}
+# ...and so does a "/" right after the ")" closing the head of one of these
+_JS_CONTROL_KEYWORDS = {"if", "while", "for", "with"}
+
+# Newlines next to these can never be needed for automatic semicolon insertion
+_JS_NEWLINE_AFTER = set("{;,([")
+_JS_NEWLINE_BEFORE = set("}])")
+
+_CSS_TOKEN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.DOTALL)
+_CSS_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', re.DOTALL)
+_CSS_SPACE_AROUND = re.compile(r'\s*([{};,>])\s*')
+
+_INLINE_SCRIPT = re.compile(r'(<script\b([^>]*)>)(.*?)(</script>)', re.DOTALL | re.IGNORECASE)
+_INLINE_STYLE = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.DOTALL | re.IGNORECASE)
+_ASSET_TAG = re.compile(r'<(?:script|link)\b[^>]*>', re.IGNORECASE)
+_LOCAL_REFERENCE = re.compile(r'\b(src|href)=(["\'])([^"\'#?]+)([^"\']*)\2', re.IGNORECASE)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in "_$"
+
+
+def minify_js(source):
+    """Strip comments and redundant whitespace from JavaScript.
+
+    Line breaks are kept wherever automatic semicolon insertion could depend
+    on them, and string, template and regex literals are copied verbatim.
+    """
+    out = []
+    last = ""          # last character written outside a literal
+    last_word = ""     # last identifier/keyword written, for regex detection
+    after_control = False  # last written ")" closed an if/while/for/with head
+    parens = []        # per open "(", whether it opened such a head
+    space = newline = False
+    mode = "code"
+    brace_depth = 0
+    template_stack = []
+    pos, end = 0, len(source)
+
+    def write(text):
+        nonlocal last, space, newline, after_control
+        after_control = False
+        first = text[0]
+        if out:
+            if newline and last not in _JS_NEWLINE_AFTER and first not in _JS_NEWLINE_BEFORE:
+                out.append("\n")
+            elif (space or newline) and (
+                (_is_word_char(last) and _is_word_char(first))
+                or (last == first and last in "+-/")
+            ):
+                out.append(" ")
+        out.append(text)
+        last = text[-1]
+        space = newline = False
+
+    while pos < end:
+        if mode == "template":
+            match = _JS_TEMPLATE_CHUNK.match(source, pos)
+            out.append(match.group())
+            pos = match.end()
+            if source.startswith("${", pos):
+                out.append("${")
+                template_stack.append(brace_depth)
+                brace_depth = 0
+                mode = "code"
+                last, last_word = "{", ""
+                pos += 2
+            elif pos < end:
+                out.append("`")
+                mode = "code"
+                last, last_word = "`", ""
+                pos += 1
+            continue
+
+        match = _JS_TOKEN.match(source, pos)
+        kind, text = match.lastgroup, match.group()
+        pos = match.end()
+
+        if kind == "ws":
+            if "\n" in text:
+                newline = True
+            else:
+                space = True
+        elif kind == "line_comment":
+            newline = True
+        elif kind == "block_comment":
+            if "\n" in text:
+                newline = True
+            else:
+                space = True
+        elif kind == "string":
+            write(text)
+            last_word = ""
+        elif kind == "word":
+            write(text)
+            last_word = text
+        elif kind == "template":
+            write(text)
+            mode = "template"
+        elif text == "/" and (
+            (last_word and last_word in _JS_REGEX_KEYWORDS)
+            or (not last_word and (not out or last in _JS_REGEX_PRECEDERS or after_control))
+        ):
+            regex = _JS_REGEX_LITERAL.match(source, match.start())
+            if regex:
+                write(regex.group())
+                pos = regex.end()
+            else:
+                write(text)
+            last_word = ""
+        else:
+            if text == "{":
+                brace_depth += 1
+            elif text == "}":
+                if brace_depth == 0 and template_stack:
+                    out.append("}")
+                    brace_depth = template_stack.pop()
+                    mode = "template"
+                    space = newline = False
+                    continue
+                brace_depth -= 1
+            elif text == "(":
+                parens.append(last_word in _JS_CONTROL_KEYWORDS)
+            closes_control = text == ")" and bool(parens) and parens.pop()
+            write(text)
+            after_control = closes_control
+            last_word = ""
+
+    return "".join(out)
+
+
+def minify_css(source):
+    """Strip comments and redundant whitespace from CSS, leaving strings intact."""
+    source = _CSS_TOKEN.sub(lambda match: match.group(1) or "", source)
+    parts = _CSS_STRING.split(source)
+    for i in range(0, len(parts), 2):
+        parts[i] = _collapse_css(parts[i])
+    return "".join(parts).strip()
+
+
+def _collapse_css(text):
+    text = re.sub(r'\s+', ' ', text)
+    text = _CSS_SPACE_AROUND.sub(r'\1', text)
+    text = text.replace(': ', ':')
+    return text.replace(';}', '}')
+
+
+def minify_page(content):
+    """Minify the inline <script> and <style> blocks of an HTML page."""
+    def script(match):
+        attributes = match.group(2).lower()
+        if "src=" in attributes or ("type=" in attributes and "javascript" not in attributes
+                                    and "module" not in attributes):
+            return match.group()
+        return match.group(1) + minify_js(match.group(3)) + match.group(4)
+
+    def style(match):
+        return match.group(1) + minify_css(match.group(2)) + match.group(3)
+
+    content = _INLINE_SCRIPT.sub(script, content)
+    return _INLINE_STYLE.sub(style, content)
+
+
+def minify_seat_page(content, seat_number, asset_map=None):
+    """minify_page() for a seat page, shared across seats rendered from one template.
+
+    The seat number is swapped for a digit-only placeholder before minifying,
+    so every seat produced from the same template hits one cache entry and
+    only pays for a few string replaces. Digits stay digits, so masking never
+    changes how the minifier tokenizes the page. With an asset_map the
+    references are rewritten as well, once per cache entry unless an asset
+    tag holds the seat number.
+    """
+    if _SEAT_PLACEHOLDER in content:
+        page = minify_page(content)
+        return page if asset_map is None else rewrite_references(page, asset_map)
+    masked = mask_seat_number(content, seat_number, _SEAT_PLACEHOLDER)
+    key = (masked, None if asset_map is None else tuple(sorted(asset_map.items())))
+    cached = _minified_pages.get(key)
+    if cached is None:
+        if len(_minified_pages) >= _MINIFIED_PAGE_CACHE_SIZE:
+            _minified_pages.clear()
+        minified = minify_page(masked)
+        per_seat = asset_map is not None and any(
+            _SEAT_PLACEHOLDER in tag for tag in _ASSET_TAG.findall(minified))
+        if asset_map is not None and not per_seat:
+            minified = rewrite_references(minified, asset_map)
+        cached = _minified_pages[key] = (minified, per_seat)
+    minified, per_seat = cached
+    page = minified.replace(_SEAT_PLACEHOLDER, str(seat_number))
+    return rewrite_references(page, asset_map) if per_seat else page
+
+
+def rewrite_references(content, asset_map):
+    """Point src/href attributes at the content-hashed asset names."""
+    def replace(match):
+        attribute, quote, path, suffix = match.groups()
+        hashed = asset_map.get(path)
+        if hashed is None:
+            return match.group()
+        return f'{attribute}={quote}{hashed}{suffix}{quote}'
+
+    return _ASSET_TAG.sub(lambda tag: _LOCAL_REFERENCE.sub(replace, tag.group()), content)
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hashed_name(path, digest):
+    """Return e.g. live-data-service.3fa2c91b0d.js for live-data-service.js."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def find_pages():
+    """Return the pages to publish, in a stable order."""
+    pages = []
+    for pattern in PAGE_PATTERNS:
+        pages.extend(sorted(glob.glob(pattern)))
+    return pages
+
+
+def _read_source(path):
+    """Return (stat signature, bytes) for path, taking the stat before reading."""
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        return (stat.st_mtime_ns, stat.st_size), f.read()
+
+
+def find_local_assets(pages, sources=None):
+    """Return the local scripts and stylesheets referenced by the pages.
+
+    sources maps pages the caller has already read to their _read_source()
+    result, so those are not read a second time.
+    """
+    assets = set()
+    for page in pages:
+        if sources and page in sources:
+            signature, raw = sources[page]
+        else:
+            stat = os.stat(page)
+            signature, raw = (stat.st_mtime_ns, stat.st_size), None
+        cached = _page_references.get(page)
+        if cached is None or cached[0] != signature:
+            if raw is None:
+                signature, raw = _read_source(page)
+            content = raw.decode('utf-8')
+            references = [ref.group(3) for tag in _ASSET_TAG.findall(content)
+                          for ref in _LOCAL_REFERENCE.finditer(tag)]
+            cached = _page_references[page] = (signature, references)
+        for path in cached[1]:
+            if (path.endswith(HASHED_EXTENSIONS) and "://" not in path
+                    and not path.startswith("//") and os.path.isfile(path)):
+                assets.add(os.path.normpath(path))
+    return sorted(assets)
+
+
+def load_manifest(dist_dir=DIST_DIR):
+    """Load the manifest of the previous build, or an empty one."""
+    path = os.path.join(dist_dir, MANIFEST_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"assets": {}, "pages": {}, "passthrough": {}}
+    for section in ("assets", "pages", "passthrough"):
+        manifest.setdefault(section, {})
+    return manifest
+
+
+def _write_if_changed(path, data):
+    """Write bytes to path unless it already holds exactly those bytes."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def _compress(path, compression="best"):
+    """Write path.gz and path.br next to path; returns their sizes."""
+    levels = COMPRESSION_LEVELS[compression]
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # mtime=0 keeps the .gz byte-identical across rebuilds
+    gz_data = gzip.compress(data, compresslevel=levels["gzip"], mtime=0)
+    with open(path + ".gz", 'wb') as f:
+        f.write(gz_data)
+    sizes = {"gzip": len(gz_data)}
+
+    if brotli is not None:
+        br_data = brotli.compress(data, quality=levels["br"])
+        with open(path + ".br", 'wb') as f:
+            f.write(br_data)
+        sizes["br"] = len(br_data)
+    return path, sizes
+
+
+def _is_compressed(path):
+    if not os.path.exists(path + ".gz"):
+        return False
+    return brotli is None or os.path.exists(path + ".br")
+
+
+def _remove_compressed(path):
+    """Delete path.gz and path.br so a server cannot serve them for a newer path."""
+    for suffix in (".gz", ".br"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return path, {}
+
+
+def _needs_compression(dist_dir, entry, compression):
+    """True if the entry's outputs are missing or weaker than `compression` asks for."""
+    if compression == "none":
+        return False
+    if not _is_compressed(os.path.join(dist_dir, entry["file"])):
+        return True
+    # Manifests written before compression modes existed were all "best"
+    return compression == "best" and entry.get("compression", "best") != "best"
+
+
+def _build_asset(source, previous, dist_dir):
+    """Minify and hash one local asset, reusing the previous build when possible."""
+    with open(source, 'rb') as f:
+        raw = f.read()
+    source_sha = content_hash(raw)
+    if previous and previous.get("source_sha256") == source_sha \
+            and os.path.exists(os.path.join(dist_dir, previous["file"])):
+        return dict(previous), False
+
+    text = raw.decode('utf-8')
+    minified = minify_css(text) if source.endswith(".css") else minify_js(text)
+    data = minified.encode('utf-8')
+    digest = content_hash(data)
+    name = hashed_name(source, digest)
+    _write_if_changed(os.path.join(dist_dir, name), data)
+    return {"file": name, "source_sha256": source_sha, "sha256": digest, "size": len(data)}, True
+
+
+def build_page(page, asset_map, dist_dir=DIST_DIR, content=None, previous_sha=None):
+    """Minify one page, rewrite its asset references and write it to dist.
+
+    previous_sha is the manifest's hash of the page already in dist; when it
+    is given the old output is trusted instead of being read back to compare.
+    """
+    if content is None:
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+    seat = _SEAT_PAGE.match(os.path.basename(page))
+    if seat:
+        content = minify_seat_page(content, seat.group(1), asset_map)
+    else:
+        content = rewrite_references(minify_page(content), asset_map)
+    data = content.encode('utf-8')
+    digest = content_hash(data)
+    target = os.path.join(dist_dir, page)
+    if previous_sha is None:
+        _write_if_changed(target, data)
+    elif previous_sha != digest or not os.path.exists(target):
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+    return {"file": page, "sha256": digest, "size": len(data)}
+
+
+def _build_page_job(args):
+    page, asset_map, dist_dir, previous_sha = args
+    return build_page(page, asset_map, dist_dir, previous_sha=previous_sha)
+
+
+def _copy_passthrough(dist_dir, previous):
+    """Copy files that must keep their names, skipping unchanged ones."""
+    copied = {}
+    paths = [p for p in PASSTHROUGH_FILES if os.path.isfile(p)]
+    for directory in PASSTHROUGH_DIRS:
+        for root, _, files in os.walk(directory):
+            paths.extend(os.path.join(root, name) for name in sorted(files))
+
+    changed = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = content_hash(data)
+        target = os.path.join(dist_dir, path)
+        old = previous.get(path)
+        if old and old.get("sha256") == digest and os.path.exists(target):
+            copied[path] = old
+            continue
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        shutil.copyfile(path, target)
+        copied[path] = {"file": path, "sha256": digest, "size": len(data)}
+        changed.append(path)
+    return copied, changed
+
+
+def _prune(dist_dir, previous, manifest):
+    """Remove outputs of the previous build that the current one no longer produces."""
+    current = {entry["file"] for section in ("assets", "pages", "passthrough")
+               for entry in manifest[section].values()}
+    removed = 0
+    for section in ("assets", "pages", "passthrough"):
+        for entry in previous[section].values():
+            if entry["file"] in current:
+                continue
+            for suffix in ("", ".gz", ".br"):
+                path = os.path.join(dist_dir, entry["file"] + suffix)
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed += 1
+    return removed
+
+
+def build(pages=None, dist_dir=DIST_DIR, workers=None, compression="best"):
+    """Run the asset pipeline and return the new manifest.
+
+    pages limits the rebuild to those pages; all other pages are carried over
+    from the previous manifest. compression is a COMPRESSION_LEVELS key.
+    Returns the manifest dict.
+    """
+    previous = load_manifest(dist_dir)
+    all_pages = find_pages()
+    targets = set(all_pages if pages is None else pages)
+    os.makedirs(dist_dir, exist_ok=True)
+
+    manifest = {"assets": {}, "pages": {}, "passthrough": {}}
+    to_compress = []
+    sources = {page: _read_source(page) for page in all_pages if page in targets}
+
+    # 1. Local scripts/styles get minified and content-hashed names
+    for source in find_local_assets(all_pages, sources):
+        entry, changed = _build_asset(source, previous["assets"].get(source), dist_dir)
+        manifest["assets"][source] = entry
+        if changed or _needs_compression(dist_dir, entry, compression):
+            to_compress.append(os.path.join(dist_dir, entry["file"]))
+    asset_map = {source: entry["file"] for source, entry in manifest["assets"].items()}
+    previous_map = {source: entry["file"] for source, entry in previous["assets"].items()}
+    if asset_map != previous_map:
+        # Every page may reference a renamed asset
+        targets = set(all_pages)
+
+    # 2. Pages: minify inline blocks and rewrite references, only where stale.
+    # A page's key hashes everything it depends on: its source and the asset names
+    asset_key = json.dumps(asset_map, sort_keys=True).encode('utf-8')
+    stale = {}
+    for page in all_pages:
+        old = previous["pages"].get(page)
+        if page not in targets and old:
+            manifest["pages"][page] = old
+            continue
+        raw = (sources.get(page) or _read_source(page))[1]
+        key = content_hash(raw + asset_key)
+        if old and old.get("key") == key and os.path.exists(os.path.join(dist_dir, page)):
+            manifest["pages"][page] = old
+            if _needs_compression(dist_dir, old, compression):
+                to_compress.append(os.path.join(dist_dir, page))
+            continue
+        stale[page] = (key, raw)
+
+    previous_shas = {page: previous["pages"].get(page, {}).get("sha256") for page in stale}
+    if len(stale) >= PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+        jobs = [(page, asset_map, dist_dir, previous_shas[page]) for page in stale]
+        # Large chunks keep each worker on a run of seats sharing one cache entry
+        chunksize = max(1, len(jobs) // ((workers or os.cpu_count()) * 2))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(_build_page_job, jobs, chunksize=chunksize))
+    else:
+        entries = [build_page(page, asset_map, dist_dir, raw.decode('utf-8'), previous_shas[page])
+                   for page, (_, raw) in stale.items()]
+
+    for page, entry in zip(stale, entries):
+        old = previous["pages"].get(page)
+        entry["key"] = stale[page][0]
+        manifest["pages"][page] = entry
+        if old and old.get("sha256") == entry["sha256"] and not _needs_compression(dist_dir, old, compression):
+            entry.update({k: old[k] for k in ("gzip", "br", "compression") if k in old})
+        else:
+            to_compress.append(os.path.join(dist_dir, page))
+
+    # 3. Runtime-fetched files keep their names
+    manifest["passthrough"], copied = _copy_passthrough(dist_dir, previous["passthrough"])
+    to_compress.extend(os.path.join(dist_dir, path) for path, entry in manifest["passthrough"].items()
+                       if path.endswith(COMPRESSED_EXTENSIONS)
+                       and (path in copied or _needs_compression(dist_dir, entry, compression)))
+
+    # 4. Precompress in parallel - zlib and brotli release the GIL
+    if to_compress and compression == "none":
+        sizes = dict(_remove_compressed(path) for path in to_compress)
+    elif to_compress:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sizes = dict(pool.map(_compress, to_compress, [compression] * len(to_compress)))
+    if to_compress:
+        for section in ("assets", "pages", "passthrough"):
+            for entry in manifest[section].values():
+                path = os.path.join(dist_dir, entry["file"])
+                if path in sizes:
+                    entry.pop("gzip", None)
+                    entry.pop("br", None)
+                    entry.update(sizes[path], compression=compression)
+
+    removed = _prune(dist_dir, previous, manifest)
+
+    manifest_data = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+    _write_if_changed(os.path.join(dist_dir, MANIFEST_NAME), manifest_data)
+
+    manifest["stats"] = {
+        "assets": len(manifest["assets"]),
+        "pages_built": len(stale),
+        "pages_total": len(manifest["pages"]),
+        "compressed": 0 if compression == "none" else len(to_compress),
+        "removed": removed,
+    }
+    return manifest
+
+
+def main():
+    """Build the dist/ directory."""
+    print("📦 Building static assets...")
+    if brotli is None:
+        print("⚠️ brotli not installed, writing gzip only (pip install brotli)")
+
+    pages = sys.argv[1:] or None
+    manifest = build(pages)
+    stats = manifest["stats"]
+
+    for source, entry in sorted(manifest["assets"].items()):
+        print(f"✅ {source} -> {entry['file']} ({entry['size']} bytes, gzip {entry.get('gzip', '?')})")
+    print(f"\n📄 Pages rebuilt: {stats['pages_built']}/{stats['pages_total']}")
+    print(f"🗜️ Files compressed: {stats['compressed']}")
+    if stats["removed"]:
+        print(f"🧹 Stale files removed: {stats['removed']}")
+    print(f"\n🎉 Assets written to {DIST_DIR}/ (manifest: {DIST_DIR}/{MANIFEST_NAME})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,29 @@
 #!/usr/bin/env python3
 """
 Script to create individual seat pages for the Hotseat Network dashboard.
-This generates seat2.html through seat5.html based on the seat1.html template.
+This generates a page for every seat in seats.json based on the seat1.html template.
 """
 
+import json
 import os
 
-def create_seat_page(seat_number):
-    """Create a seat page for the given seat number."""
-    
-    # Read the seat1.html template
-    with open('seat1.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+TEMPLATE_FILE = 'seat1.html'
+SEAT_REGISTRY = 'seats.json'
+TEMPLATE_SEAT = 1
+
+# Text directly in front of the seat number in a rendered page
+SEAT_NUMBER_PREFIXES = ('seat', 'Seat', 'Seat ', 'person-donut-chart-', 'seatId === ', "seatId === '",
+                        'getSeatData(', "updateSeatData('")
+
+def load_seat_ids(registry=SEAT_REGISTRY):
+    """Return the seat ids listed in the registry, defaulting to seats 1-5."""
+    if not os.path.exists(registry):
+        return list(range(1, 6))
+    with open(registry, 'r', encoding='utf-8') as f:
+        return sorted(int(seat_id) for seat_id in json.load(f)['seats'])
+
+def render_seat_page(content, seat_number):
+    """Return the template content rewritten for the given seat number."""
     # Replace all occurrences of "Seat 1" with the new seat number
     content = content.replace('Seat 1', f'Seat {seat_number}')
     content = content.replace('seat1', f'seat{seat_number}')
@@ -29,6 +40,30 @@ def create_seat_page(seat_number):
     # Update the seat-specific logic in JavaScript
     content = content.replace("if (seatId === '1')", f"if (seatId === '{seat_number}')")
     content = content.replace("if (seatId === 1)", f"if (seatId === {seat_number})")
+    content = content.replace("getSeatData(1)", f"getSeatData({seat_number})")
+    content = content.replace("updateSeatData('1',", f"updateSeatData('{seat_number}',")
+    return content
+
+def mask_seat_number(content, seat_number, placeholder):
+    """Replace the seat number with placeholder wherever render_seat_page put it."""
+    # One split on the number beats a str.replace per prefix; the prefixes
+    # hold no digits, so each can only end the text right before a split
+    number = str(seat_number)
+    parts = content.split(number)
+    masked = [parts[0]]
+    for before, part in zip(parts, parts[1:]):
+        masked.append(placeholder if before.endswith(SEAT_NUMBER_PREFIXES) else number)
+        masked.append(part)
+    return ''.join(masked)
+
+def create_seat_page(seat_number):
+    """Create a seat page for the given seat number."""
+    
+    # Read the seat1.html template
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    content = render_seat_page(content, seat_number)
     
     # Write the new file
     filename = f'seat{seat_number}.html'
@@ -38,24 +73,23 @@ def create_seat_page(seat_number):
     print(f"✅ Created {filename}")
 
 def main():
-    """Create pages for seats 2-5."""
+    """Create pages for every registered seat except the template seat."""
     print("Creating individual seat pages...")
     
-    for seat_num in range(2, 6):
+    seat_ids = [seat_id for seat_id in load_seat_ids() if seat_id != TEMPLATE_SEAT]
+    for seat_num in seat_ids:
         create_seat_page(seat_num)
     
     print("\n🎉 All seat pages created successfully!")
     print("\nAvailable pages:")
-    print("- seat1.html (already existed)")
-    for seat_num in range(2, 6):
+    print(f"- {TEMPLATE_FILE} (already existed)")
+    for seat_num in seat_ids:
         print(f"- seat{seat_num}.html")
     
     print("\nYou can now access individual seat dashboards at:")
-    print("- http://localhost:8000/seat1.html")
-    print("- http://localhost:8000/seat2.html")
-    print("- http://localhost:8000/seat3.html")
-    print("- http://localhost:8000/seat4.html")
-    print("- http://localhost:8000/seat5.html")
+    print(f"- http://localhost:8000/{TEMPLATE_FILE}")
+    for seat_num in seat_ids:
+        print(f"- http://localhost:8000/seat{seat_num}.html")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,7 +3,10 @@ import json
 import os
 import sys
 
-def main():
+from create_seat_pages import load_seat_ids
+
+def main(seat_ids=None):
+    """Generate QR codes for the given seats, or for every seat and dashboard."""
     # Configuration - Change this based on your setup
     # For local development
     # base_url = "http://localhost:8000/"
@@ -56,8 +59,11 @@ def main():
     print("-" * 50)
 
     generated_files = []
+    only_seats = seat_ids is not None
+    if seat_ids is None:
+        seat_ids = load_seat_ids()
 
-    for seat_id in range(1, 6):
+    for seat_id in seat_ids:
         # Create seat-specific URL for individual seat page
         seat_url = f"{base_url}seat{seat_id}.html"
         filename = f"seat_{seat_id}_qr.png"
@@ -65,37 +71,40 @@ def main():
         if result:
             generated_files.append(result)
 
-    # Generate main dashboard QR code
-    main_url = base_url
-    result = generate_qr_code(main_url, "main_dashboard_qr.png", "Main Dashboard")
-    if result:
-        generated_files.append(result)
+    if not only_seats:
+        # Generate main dashboard QR code
+        main_url = base_url
+        result = generate_qr_code(main_url, "main_dashboard_qr.png", "Main Dashboard")
+        if result:
+            generated_files.append(result)
 
-    # Generate analytics dashboard QR code
-    analytics_url = f"{base_url}analytics.html"
-    result = generate_qr_code(analytics_url, "analytics_qr.png", "Analytics Dashboard")
-    if result:
-        generated_files.append(result)
+        # Generate analytics dashboard QR code
+        analytics_url = f"{base_url}analytics.html"
+        result = generate_qr_code(analytics_url, "analytics_qr.png", "Analytics Dashboard")
+        if result:
+            generated_files.append(result)
 
-    # Generate AR dashboard QR code (if you have one)
-    ar_url = f"{base_url}?ar=true"
-    result = generate_qr_code(ar_url, "ar_dashboard_qr.png", "AR Dashboard")
-    if result:
-        generated_files.append(result)
+        # Generate AR dashboard QR code (if you have one)
+        ar_url = f"{base_url}?ar=true"
+        result = generate_qr_code(ar_url, "ar_dashboard_qr.png", "AR Dashboard")
+        if result:
+            generated_files.append(result)
 
     print("\n" + "=" * 50)
     print("📱 QR Code URLs Generated:")
     print("=" * 50)
-    for seat_id in range(1, 6):
+    for seat_id in seat_ids:
         print(f"Seat {seat_id}: {base_url}seat{seat_id}.html")
-    print(f"Main Dashboard: {base_url}")
-    print(f"Analytics: {base_url}analytics.html")
-    print(f"AR Dashboard: {base_url}?ar=true")
+    if not only_seats:
+        print(f"Main Dashboard: {base_url}")
+        print(f"Analytics: {base_url}analytics.html")
+        print(f"AR Dashboard: {base_url}?ar=true")
 
     print(f"\n📁 All QR codes saved in: {qr_dir}/")
     print(f"✅ Successfully generated {len(generated_files)} QR codes")
     
-    if len(generated_files) < 8:  # Expected number of files
+    expected = len(seat_ids) if only_seats else len(seat_ids) + 3  # Seats plus dashboards
+    if len(generated_files) < expected:
         print("⚠️ Warning: Some QR codes may not have been generated successfully")
     
     print("\n🎉 QR code generation complete!")
@@ -107,7 +116,8 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        # Optional seat ids limit generation to those seats, e.g. "python generate_qr_codes.py 6 7"
+        main([int(arg) for arg in sys.argv[1:]] or None)
     except KeyboardInterrupt:
         print("\n⚠️ QR code generation interrupted by user")
         sys.exit(1)
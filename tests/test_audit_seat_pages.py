@@ -0,0 +1,71 @@
+"""Pin how the seat page audit masks seat numbers and reports drifted blocks."""
+
+import os
+
+import pytest
+
+import create_seat_pages
+import watch_site
+from audit_seat_pages import block_diff, fingerprint_page
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE = """<style>
+.seat{N} {{ color: red; }}
+</style>
+<script>
+const seat{N}Data = await FirestoreService.getSeatData({N});
+updateSeatData('{N}', seat{N}Data.current_session);
+</script>
+<script>
+console.log('ready');
+</script>
+"""
+
+
+def _write(tmp_path, seat_number, content):
+    path = tmp_path / f"seat{seat_number}.html"
+    path.write_text(content.replace("{N}", str(seat_number)).replace("{{", "{").replace("}}", "}"),
+                    encoding='utf-8')
+    return str(path)
+
+
+def test_seat_numbers_are_masked(tmp_path):
+    _, reference, _ = fingerprint_page(_write(tmp_path, 2, PAGE))
+    _, outlier, _ = fingerprint_page(_write(tmp_path, 17, PAGE))
+    assert reference == outlier
+
+
+def test_block_diff_pairs_blocks_around_an_added_block(tmp_path):
+    reference = fingerprint_page(_write(tmp_path, 2, PAGE))
+    drifted = PAGE.replace("<script>\nconst", "<script src=\"mqtt.js\"></script>\n<script>\nconst")
+    drifted = drifted.replace("'ready'", "'go'")
+    outlier = fingerprint_page(_write(tmp_path, 3, drifted))
+
+    diff = block_diff(reference[0], reference[2], outlier[0], outlier[2])
+    assert diff[:4] == ["--- seat2.html blocks", "+++ seat3.html blocks",
+                        "@@ -2,0 +2,1 @@", '+<script src="mqtt.js"> #1']
+    assert "-console.log('ready');" in diff
+    assert "+console.log('go');" in diff
+    # The unchanged data block is paired up despite its shifted position
+    assert not any("getSeatData" in line for line in diff)
+
+
+@pytest.mark.parametrize("migrated", [False, True])
+def test_rendered_seats_share_one_fingerprint(tmp_path, monkeypatch, migrated):
+    # The real template holds literal 'Seat 2'..'Seat 5' chart labels that
+    # render_seat_page leaves alone; they must not be masked on those seats
+    monkeypatch.chdir(REPO_ROOT)
+    if migrated:
+        render = watch_site.WatchState(build_dist=False).render
+    else:
+        with open(create_seat_pages.TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+            template = f.read()
+        render = lambda seat_number: create_seat_pages.render_seat_page(template, seat_number)
+
+    fingerprints = set()
+    for seat_number in (2, 3, 4, 5, 12, 1000):
+        path = tmp_path / f"seat{seat_number}.html"
+        path.write_text(render(seat_number), encoding='utf-8')
+        fingerprints.add(fingerprint_page(str(path))[1])
+    assert len(fingerprints) == 1
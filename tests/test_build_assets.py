@@ -0,0 +1,83 @@
+"""Pin the edge cases of the hand-written JS/CSS minifier in build_assets.py
+and the incremental recompression rules of build()."""
+
+import pytest
+
+import build_assets
+from build_assets import minify_css, minify_js, minify_page, rewrite_references
+
+
+@pytest.mark.parametrize("source, expected", [
+    # Newlines that automatic semicolon insertion depends on are kept
+    ("a\n++b", "a\n++b"),
+    ("let x = 1 // comment\nlet y = 2", "let x=1\nlet y=2"),
+    # Regex literals after keywords and operators are copied verbatim
+    ("function f() {\n  return /re+/.test(x)\n}", "function f(){return/re+/.test(x)}"),
+    ("const r = /[/]/g;", "const r=/[/]/g;"),
+    # ...including right after the head of an if/while, quotes and all
+    ("if (x) /a  b/.test(y)", "if(x)/a  b/.test(y)"),
+    ("while (f(i)) /'/.test(s) && g('  ')", "while(f(i))/'/.test(s)&&g('  ')"),
+    # ...while "/" after an operand is division
+    ("let d = a / b / c;", "let d=a/b/c;"),
+    ("let h = f(x) / 2 / (y) / 3;", "let h=f(x)/2/(y)/3;"),
+    # Nested template literals and object literals inside substitutions
+    ("const s = `${ {a:1}.a }`;", "const s=`${{a:1}.a}`;"),
+    ("const t = `a\n   b ${ `c ${d}` } e`;", "const t=`a\n   b ${`c ${d}`} e`;"),
+    # Adjacent + and - never merge into ++ or --
+    ("x = a++ + ++b;", "x=a++ + ++b;"),
+    ("y = a - -b;", "y=a- -b;"),
+    # Comment markers inside strings are not comments
+    ('const s = "a // b /* c */";', 'const s="a // b /* c */";'),
+])
+def test_minify_js(source, expected):
+    assert minify_js(source) == expected
+
+
+@pytest.mark.parametrize("source, expected", [
+    ('a::after { content: "  a  /* b */ " ; color : red ; }',
+     'a::after{content:"  a  /* b */ ";color :red}'),
+    ("@media (max-width: 600px) { .x , .y > p { margin: 0 auto; } }",
+     "@media (max-width:600px){.x,.y>p{margin:0 auto}}"),
+])
+def test_minify_css(source, expected):
+    assert minify_css(source) == expected
+
+
+def test_minify_page_skips_external_and_data_scripts():
+    page = ('<script src="a.js">  </script>'
+            '<script type="application/json">{ "a" : 1 }</script>'
+            '<script>\n  var a = 1 ;\n</script>')
+    assert minify_page(page) == ('<script src="a.js">  </script>'
+                                 '<script type="application/json">{ "a" : 1 }</script>'
+                                 '<script>var a=1;</script>')
+
+
+def test_rewrite_references_only_touches_asset_tags():
+    page = '<script src="app.js?v=1"></script><a href="app.js">app</a>'
+    assert rewrite_references(page, {"app.js": "app.0123456789.js"}) == (
+        '<script src="app.0123456789.js?v=1"></script><a href="app.js">app</a>')
+
+
+def test_best_build_compresses_what_watch_mode_left(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    page = tmp_path / "analytics.html"
+    page.write_text("<p>" + "hotseat " * 200 + "</p>")
+    (tmp_path / "mqtt-config.json").write_text('{"host": "example"}')
+
+    best = build_assets.build()
+    assert best["stats"]["compressed"] == 2
+    assert (tmp_path / "dist" / "analytics.html.gz").exists()
+
+    # A page rebuilt without compression loses its now stale .gz
+    page.write_text("<p>" + "hotseat " * 300 + "</p>")
+    watch = build_assets.build(["analytics.html"], compression="none")
+    assert watch["stats"]["compressed"] == 0
+    assert watch["pages"]["analytics.html"]["compression"] == "none"
+    assert "gzip" not in watch["pages"]["analytics.html"]
+    assert not (tmp_path / "dist" / "analytics.html.gz").exists()
+    assert (tmp_path / "dist" / "mqtt-config.json.gz").exists()
+
+    best = build_assets.build()
+    assert best["stats"]["compressed"] == 1
+    assert best["pages"]["analytics.html"]["compression"] == "best"
+    assert build_assets.build()["stats"]["compressed"] == 0
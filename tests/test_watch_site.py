@@ -0,0 +1,61 @@
+"""Pin the watcher's fast seat rendering and its handling of hand-edited pages."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import create_seat_pages
+import update_seat_durations
+import update_seat_files
+import watch_site
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    shutil.copy(os.path.join(REPO_ROOT, create_seat_pages.TEMPLATE_FILE), tmp_path)
+    (tmp_path / create_seat_pages.SEAT_REGISTRY).write_text(json.dumps({"seats": [1, 2, 3]}))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _reference_page(seat_number):
+    with open(create_seat_pages.TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+    content = update_seat_durations.migrate_content(update_seat_files.migrate_content(content))
+    return create_seat_pages.render_seat_page(content, seat_number)
+
+
+@pytest.mark.parametrize("seat_number", [2, 5, 11, 120])
+def test_render_matches_render_seat_page(site, seat_number):
+    state = watch_site.WatchState(build_dist=False)
+    page = state.render(seat_number)
+    assert page == _reference_page(seat_number)
+    assert f"getSeatData({seat_number})" in page
+    assert f"updateSeatData('{seat_number}'," in page
+
+
+def test_template_change_keeps_hand_edited_pages(site, capsys):
+    state = watch_site.WatchState(build_dist=False)
+    (site / "seat2.html").write_text(state.render(2), encoding='utf-8')
+    (site / "seat3.html").write_text(state.render(3).replace("</body>", "<!-- mine --></body>"),
+                                     encoding='utf-8')
+
+    template = site / create_seat_pages.TEMPLATE_FILE
+    template.write_text(template.read_text(encoding='utf-8').replace("</title>", " </title>"),
+                        encoding='utf-8')
+    written, kept, pages, _ = watch_site.regenerate({create_seat_pages.TEMPLATE_FILE}, state)
+
+    assert written == ["seat2.html"]
+    assert kept == ["seat3.html"]
+    assert pages == {create_seat_pages.TEMPLATE_FILE, "seat2.html"}
+    assert "seat3.html" in capsys.readouterr().out
+    assert "<!-- mine -->" in (site / "seat3.html").read_text(encoding='utf-8')
+
+    state.overwrite = True
+    written, kept, _, _ = watch_site.regenerate({create_seat_pages.TEMPLATE_FILE}, state)
+    assert (written, kept) == (["seat3.html"], [])
+    assert (site / "seat3.html").read_text(encoding='utf-8') == state.render(3)
@@ -5,13 +5,8 @@ Update all seat pages to use HH:MM:SS duration format
 
 import re
 
-def update_seat_file(filename):
-    """Update a seat file with the new duration format"""
-    print(f"Updating {filename}...")
-    
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def migrate_content(content):
+    """Return seat page content using the new duration format"""
     # Replace the duration calculation
     old_pattern = r'const sessionDurationMinutes = Math\.round\(data\.session_duration_ms / 60000\);'
     new_pattern = '''// Calculate session duration in HH:MM:SS format
@@ -24,12 +19,22 @@ def update_seat_file(filename):
     content = re.sub(old_pattern, new_pattern, content)
     
     # Replace duration display
-    content = re.sub(r'document\.getElementById\(`seat\d+-duration`\)\.textContent = sessionDurationMinutes;',
-                    r'document.getElementById(`seat\d+-duration`).textContent = formattedDuration;', content)
+    content = re.sub(r'(document\.getElementById\(([\'`])seat\d+-duration\2\)\.textContent = )sessionDurationMinutes;',
+                    r'\1formattedDuration;', content)
     
     # Replace session duration display
-    content = re.sub(r'document\.getElementById\(`seat\d+-session-duration`\)\.textContent = `\${sessionDurationMinutes} min`;',
-                    r'document.getElementById(`seat\d+-session-duration`).textContent = formattedDuration;', content)
+    content = re.sub(r'(document\.getElementById\(([\'`])seat\d+-session-duration\2\)\.textContent = )`\${sessionDurationMinutes} min`;',
+                    r'\1formattedDuration;', content)
+    return content
+
+def update_seat_file(filename):
+    """Update a seat file with the new duration format"""
+    print(f"Updating {filename}...")
+    
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    content = migrate_content(content)
     
     with open(filename, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -7,13 +7,8 @@ and fix the missing FirestoreService.updateDailyUsage function error.
 import os
 import re
 
-def update_seat_file(filename):
-    """Update a seat HTML file to use the new Firestore architecture."""
-    print(f"🔄 Updating {filename}...")
-    
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def migrate_content(content):
+    """Return seat page content migrated to the new Firestore architecture."""
     # Fix 1: Remove the problematic FirestoreService.updateDailyUsage call
     content = re.sub(
         r'// Save to Firestore\s+if \(firestoreEnabled\) \{\s+FirestoreService\.updateDailyUsage\([^)]+\);\s+\}',
@@ -27,7 +22,7 @@ def update_seat_file(filename):
         # Find the global variables section and add our new variables
         content = re.sub(
             r'(let currentDate = new Date\(\)\.toDateString\(\);[\s\n]+let firestoreEnabled = false;)',
-            r'\1\n        let liveDataService = null;\n        let dataSource = \'firestore\'; // \'firestore\' or \'mqtt\' or \'demo\'',
+            r"\1\n        let liveDataService = null;\n        let dataSource = 'firestore'; // 'firestore' or 'mqtt' or 'demo'",
             content
         )
     
@@ -164,6 +159,16 @@ def update_seat_file(filename):
         'statusEl.textContent = `${dataSource.toUpperCase()}: ${message}`;',
         content
     )
+    return content
+
+def update_seat_file(filename):
+    """Update a seat HTML file to use the new Firestore architecture."""
+    print(f"🔄 Updating {filename}...")
+    
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    content = migrate_content(content)
     
     # Write the updated content back to the file
     with open(filename, 'w', encoding='utf-8') as f:
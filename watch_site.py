@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the Hotseat Network site.
+Watches the seat template, the seat registry and the config files and, after
+a burst of saves settles, regenerates only the seat pages, QR codes, plates
+and dist/ assets affected by the change. Every rebuild reports its latency,
+the pages first and the dist/ stage once it has finished. dist/ is not
+precompressed here; run build_assets.py before deploying.
+
+Uses inotify on Linux and falls back to polling file stats elsewhere.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import fnmatch
+import importlib
+import os
+import select
+import struct
+import subprocess
+import sys
+import time
+
+import build_assets
+import create_seat_pages
+import update_seat_durations
+import update_seat_files
+
+DEBOUNCE_SECONDS = 0.15
+POLL_INTERVAL = 0.25
+DIST_COMPRESSION = "none"
+
+MIGRATION_MODULES = {
+    "update_seat_files.py": update_seat_files,
+    "update_seat_durations.py": update_seat_durations,
+}
+QR_SCRIPT = "generate_qr_codes.py"
+PLATE_SCRIPTS = ["generate_laser_cut_pdf.py", "generate_laser_cut_dxf.py"]
+PLATE_SEATS = set(range(1, 6))  # The laser-cut plate layouts hold seats 1-5
+
+# Stands in for the seat number so the template is rendered once per change
+_SEAT_SENTINEL = "\x00seat\x00"
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+_INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def inotify_poller(directory="."):
+    """Return poll(timeout) -> set of changed names backed by inotify, or None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _INOTIFY_MASK) < 0:
+        os.close(fd)
+        return None
+
+    def poll(timeout):
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        names = set()
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                names.add(os.fsdecode(name))
+        return names
+
+    return poll
+
+
+def _stat_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def stat_poller(list_paths, interval=POLL_INTERVAL):
+    """Return poll(timeout) -> set of changed names by comparing file stats."""
+    snapshot = {path: _stat_signature(path) for path in list_paths()}
+
+    def poll(timeout):
+        nonlocal snapshot
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = {path: _stat_signature(path) for path in list_paths()}
+            changed = {path for path in current.keys() | snapshot.keys()
+                       if current.get(path) != snapshot.get(path)}
+            snapshot = current
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(interval)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(interval, remaining))
+
+    return poll
+
+
+def wait_for_changes(poll, is_relevant, debounce=DEBOUNCE_SECONDS):
+    """Block until relevant files change, then until saves stop for `debounce` seconds."""
+    changed = set()
+    while not changed:
+        changed = {name for name in poll(None) if is_relevant(name)}
+    while True:
+        more = {name for name in poll(debounce) if is_relevant(name)}
+        if not more:
+            return changed
+        changed |= more
+
+
+class WatchState:
+    """What the watcher knows about the site between rebuilds."""
+
+    def __init__(self, build_dist=True, overwrite=False):
+        self.build_dist = build_dist
+        self.overwrite = overwrite
+        self.seat_ids = create_seat_pages.load_seat_ids()
+        self.assets = set(build_assets.find_local_assets(build_assets.find_pages()))
+        self.written = {}  # path -> stat signature of our own last write
+        self.seat_template = None
+        self.template_source = None
+        # Render the current template up front so hand edits made before the
+        # first change can be told apart from stale generated pages
+        self.load_template()
+
+    def watched_paths(self):
+        paths = {create_seat_pages.TEMPLATE_FILE, create_seat_pages.SEAT_REGISTRY, QR_SCRIPT}
+        paths.update(MIGRATION_MODULES)
+        paths.update(build_assets.PASSTHROUGH_FILES)
+        paths.update(build_assets.find_pages())
+        paths.update(self.assets)
+        return sorted(paths)
+
+    def is_relevant(self, name):
+        name = os.path.normpath(name)
+        watched = (
+            name in (create_seat_pages.TEMPLATE_FILE, create_seat_pages.SEAT_REGISTRY, QR_SCRIPT)
+            or name in MIGRATION_MODULES
+            or name in build_assets.PASSTHROUGH_FILES
+            or name in self.assets
+            or any(fnmatch.fnmatchcase(name, pattern) for pattern in build_assets.PAGE_PATTERNS)
+        )
+        if not watched:
+            return False
+        # Ignore the echo of pages this watcher wrote itself
+        return name not in self.written or self.written[name] != _stat_signature(name)
+
+    def load_template(self):
+        """Re-read the seat template, migrating and pre-rendering it if it changed.
+
+        The migrated template is rendered once with a sentinel seat number;
+        each seat is then a single str.replace instead of the full set of
+        template substitutions.
+        """
+        with open(create_seat_pages.TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+            source = f.read()
+        if source != self.template_source:
+            content = update_seat_files.migrate_content(source)
+            content = update_seat_durations.migrate_content(content)
+            self.seat_template = create_seat_pages.render_seat_page(content, _SEAT_SENTINEL)
+            self.template_source = source
+
+    def render(self, seat_number, template=None):
+        """Return the page for a seat, as create_seat_pages plus both migrations would."""
+        return (template or self.seat_template).replace(_SEAT_SENTINEL, str(seat_number))
+
+
+def _read_page(path):
+    """Return the contents of path, or None if it does not exist."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_page(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _run_script(script, *args):
+    """Run a generator script, returning True on success."""
+    result = subprocess.run([sys.executable, script, *map(str, args)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        error = (result.stderr or result.stdout).strip().splitlines()
+        print(f"❌ {script} failed: {error[-1] if error else result.returncode}")
+        return False
+    return True
+
+
+def regenerate(changed, state):
+    """Regenerate the pages, QR codes and plates affected by the changed files.
+
+    Returns the seat pages written, the hand-edited seat pages kept, all pages
+    changed and the time each step took in milliseconds.
+    """
+    timings = {}
+    start = time.perf_counter()
+    seats_to_render = set()
+    qr_seats = set()
+    written, kept = [], []
+
+    migrations = changed & MIGRATION_MODULES.keys()
+    for name in migrations:
+        importlib.reload(MIGRATION_MODULES[name])
+    if migrations:
+        state.template_source = None
+
+    if create_seat_pages.SEAT_REGISTRY in changed:
+        try:
+            seat_ids = create_seat_pages.load_seat_ids()
+        except (ValueError, KeyError) as e:
+            print(f"❌ Could not read {create_seat_pages.SEAT_REGISTRY}: {e}")
+            seat_ids = state.seat_ids
+        added = set(seat_ids) - set(state.seat_ids)
+        removed = set(state.seat_ids) - set(seat_ids)
+        if removed:
+            print(f"⚠️ Seats removed from registry, pages left in place: {sorted(removed)}")
+        seats_to_render |= added
+        qr_seats |= added
+        state.seat_ids = seat_ids
+
+    if create_seat_pages.TEMPLATE_FILE in changed or migrations:
+        seats_to_render |= set(state.seat_ids)
+    seats_to_render.discard(create_seat_pages.TEMPLATE_SEAT)
+    all_qr = QR_SCRIPT in changed
+
+    # Pages edited by hand still need their dist copy refreshed
+    pages = {name for name in changed
+             if any(fnmatch.fnmatchcase(name, pattern) for pattern in build_assets.PAGE_PATTERNS)}
+
+    if seats_to_render:
+        render_start = time.perf_counter()
+        previous_template = state.seat_template
+        state.load_template()
+        for seat_number in sorted(seats_to_render):
+            filename = f'seat{seat_number}.html'
+            content = state.render(seat_number)
+            current = _read_page(filename)
+            if current == content:
+                continue
+            # Only replace pages that still match what the old template produced
+            if (current is not None and not state.overwrite
+                    and current != state.render(seat_number, previous_template)):
+                kept.append(filename)
+                continue
+            _write_page(filename, content)
+            state.written[filename] = _stat_signature(filename)
+            written.append(filename)
+            pages.add(filename)
+        if kept:
+            shown = ", ".join(kept[:5]) + (f" +{len(kept) - 5} more" if len(kept) > 5 else "")
+            print(f"⚠️ Kept hand-edited page(s), use --overwrite to replace them: {shown}")
+        timings["render"] = (time.perf_counter() - render_start) * 1000
+
+    if all_qr or qr_seats:
+        qr_start = time.perf_counter()
+        if _run_script(QR_SCRIPT, *([] if all_qr else sorted(qr_seats))):
+            if all_qr or qr_seats & PLATE_SEATS:
+                for script in PLATE_SCRIPTS:
+                    _run_script(script)
+        timings["qr"] = (time.perf_counter() - qr_start) * 1000
+
+    timings["total"] = (time.perf_counter() - start) * 1000
+    return written, kept, pages, timings
+
+
+def rebuild_dist(pages, state):
+    """Rebuild dist/ for the changed pages; returns the build stats and its time in ms."""
+    start = time.perf_counter()
+    manifest = build_assets.build(pages, compression=DIST_COMPRESSION)
+    # The manifest lists exactly the local assets the pages reference
+    state.assets = set(manifest["assets"])
+    return manifest["stats"], (time.perf_counter() - start) * 1000
+
+
+def _report(changed, written, kept, pages, timings):
+    stamp = time.strftime("%H:%M:%S")
+    names = ", ".join(sorted(changed)[:3]) + (f" +{len(changed) - 3}" if len(changed) > 3 else "")
+    parts = [f"{len(written)} seat pages written"]
+    if kept:
+        parts.append(f"{len(kept)} hand-edited kept")
+    parts.append(f"{len(pages)} pages changed")
+    steps = " · ".join(f"{step} {ms:.0f} ms" for step, ms in timings.items() if step != "total")
+    print(f"🔁 [{stamp}] {names} → {', '.join(parts)} in {timings['total']:.0f} ms"
+          + (f" ({steps})" if steps else ""))
+
+
+def _report_dist(stats, ms):
+    print(f"   📦 dist/ → {stats['pages_built']} pages built in {ms:.0f} ms")
+
+
+def main():
+    """Watch the site sources and rebuild on change."""
+    parser = argparse.ArgumentParser(description="Regenerate seat pages and assets on change.")
+    parser.add_argument("--poll", action="store_true", help="use stat polling instead of inotify")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE_SECONDS,
+                        help=f"seconds of quiet before rebuilding (default {DEBOUNCE_SECONDS})")
+    parser.add_argument("--no-assets", action="store_true", help="skip the dist/ asset pipeline")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="replace seat pages even if they were edited by hand")
+    args = parser.parse_args()
+
+    state = WatchState(build_dist=not args.no_assets, overwrite=args.overwrite)
+    poll = None if args.poll else inotify_poller(".")
+    backend = "inotify"
+    if poll is None:
+        poll = stat_poller(state.watched_paths)
+        backend = "polling"
+
+    if state.build_dist:
+        start = time.perf_counter()
+        build_assets.build(compression=DIST_COMPRESSION)
+        print(f"📦 Initial asset build in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print(f"👀 Watching {len(state.watched_paths())} files for {len(state.seat_ids)} seats ({backend}), Ctrl+C to stop")
+    try:
+        while True:
+            changed = {os.path.normpath(name)
+                       for name in wait_for_changes(poll, state.is_relevant, args.debounce)}
+            try:
+                written, kept, pages, timings = regenerate(changed, state)
+                _report(changed, written, kept, pages, timings)
+                if state.build_dist:
+                    _report_dist(*rebuild_dist(pages, state))
+            except Exception as e:
+                print(f"❌ Rebuild failed: {e}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+if __name__ == "__main__":
+    main()